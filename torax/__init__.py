@@ -90,4 +90,5 @@ CANONICAL_ORDER = [
     'maxiter',
     'tol',
     'delta_reduction_factor',
+    'tau_min',
 ]
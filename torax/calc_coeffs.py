@@ -284,31 +284,26 @@ def _calc_coeffs_full(
   # recalculate here to avoid issues with JAX branching in the logic.
   # Decide which values to use depending on whether the source is explicit or
   # implicit.
+  bootstrap_is_explicit = dynamic_runtime_params_slice.sources[
+      source_models.j_bootstrap_name
+  ].is_explicit
   sigma = jax_utils.select(
-      dynamic_runtime_params_slice.sources[
-          source_models.j_bootstrap_name
-      ].is_explicit,
+      bootstrap_is_explicit,
       explicit_source_profiles.j_bootstrap.sigma,
       implicit_source_profiles.j_bootstrap.sigma,
   )
   j_bootstrap = jax_utils.select(
-      dynamic_runtime_params_slice.sources[
-          source_models.j_bootstrap_name
-      ].is_explicit,
+      bootstrap_is_explicit,
       explicit_source_profiles.j_bootstrap.j_bootstrap,
       implicit_source_profiles.j_bootstrap.j_bootstrap,
   )
   j_bootstrap_face = jax_utils.select(
-      dynamic_runtime_params_slice.sources[
-          source_models.j_bootstrap_name
-      ].is_explicit,
+      bootstrap_is_explicit,
       explicit_source_profiles.j_bootstrap.j_bootstrap_face,
       implicit_source_profiles.j_bootstrap.j_bootstrap_face,
   )
   I_bootstrap = jax_utils.select(  # pylint: disable=invalid-name
-      dynamic_runtime_params_slice.sources[
-          source_models.j_bootstrap_name
-      ].is_explicit,
+      bootstrap_is_explicit,
       explicit_source_profiles.j_bootstrap.I_bootstrap,
       implicit_source_profiles.j_bootstrap.I_bootstrap,
   )
@@ -329,9 +329,12 @@ def _build_single_source_from_config(
       formula = formulas.Gaussian()
     else:
       raise ValueError(f'Unknown formula_type for source {source_name}: {func}')
-  runtime_params = config_args.recursive_replace(
-      runtime_params, ignore_extra_kwargs=True, **source_config
-  )
+  # The mode and formula are set in place above, so only rebuild the runtime
+  # params if the config overrides other fields too.
+  if source_config:
+    runtime_params = config_args.recursive_replace(
+        runtime_params, ignore_extra_kwargs=True, **source_config
+    )
   kwargs = {'runtime_params': runtime_params}
   if formula is not None:
     kwargs['formula'] = formula
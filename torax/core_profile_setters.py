@@ -20,6 +20,8 @@ evolved by the PDE system.
 """
 
 import dataclasses
+import functools
+import chex
 import jax
 from jax import numpy as jnp
 from torax import constants
@@ -745,6 +747,10 @@ def updated_prescribed_core_profiles(
   return {'temp_ion': temp_ion, 'temp_el': temp_el, 'ne': ne, 'ni': ni}
 
 
+@functools.partial(
+    jax_utils.jit,
+    static_argnames=['evolving_names'],
+)
 def update_evolving_core_profiles(
     x_new: tuple[fvm.cell_variable.CellVariable, ...],
     dynamic_runtime_params_slice: runtime_params_slice.DynamicRuntimeParamsSlice,
@@ -760,18 +766,10 @@ def update_evolving_core_profiles(
     evolving_names: The names of the evolving variables.
   """
 
-  def get_update(x_new, var):
-    """Returns the new value of `var`."""
-    if var in evolving_names:
-      return x_new[evolving_names.index(var)]
-    # `var` is not evolving, so its new value is just its old value
-    return getattr(core_profiles, var)
-
-  temp_ion = get_update(x_new, 'temp_ion')
-  temp_el = get_update(x_new, 'temp_el')
-  psi = get_update(x_new, 'psi')
-  ne = get_update(x_new, 'ne')
-  ni = dataclasses.replace(
+  # Variables which are not evolving keep their old value.
+  updates = dict(zip(evolving_names, x_new))
+  ne = updates.get('ne', core_profiles.ne)
+  updates['ni'] = dataclasses.replace(
       core_profiles.ni,
       value=ne.value
       * physics.get_main_ion_dilution_factor(
@@ -780,20 +778,29 @@ def update_evolving_core_profiles(
       ),
   )
 
-  return dataclasses.replace(
-      core_profiles,
-      temp_ion=temp_ion,
-      temp_el=temp_el,
-      psi=psi,
-      ne=ne,
-      ni=ni,
-  )
+  return dataclasses.replace(core_profiles, **updates)
 
 
+@chex.dataclass(frozen=True)
+class BoundaryConditions:
+  """Boundary condition updates for each core profile CellVariable.
+
+  Each field holds the CellVariable attributes to update for that profile,
+  as keyword arguments for `dataclasses.replace`.
+  """
+
+  temp_ion: dict[str, jax.Array | None]
+  temp_el: dict[str, jax.Array | None]
+  ne: dict[str, jax.Array | None]
+  ni: dict[str, jax.Array | None]
+  psi: dict[str, jax.Array | None]
+
+
+@jax_utils.jit
 def compute_boundary_conditions(
     dynamic_runtime_params_slice: runtime_params_slice.DynamicRuntimeParamsSlice,
     geo: geometry.Geometry,
-) -> dict[str, dict[str, jax.Array | None]]:
+) -> BoundaryConditions:
   """Computes boundary conditions for time t and returns updates to State.
 
   Args:
@@ -801,9 +808,8 @@ def compute_boundary_conditions(
     geo: Geometry object
 
   Returns:
-    Mapping from State attribute names to dictionaries updating attributes of
-    each CellVariable in the state. This dict can in theory recursively replace
-    values in a State object.
+    Updates to the attributes of each CellVariable in the state. This can in
+    theory recursively replace values in a State object.
   """
   Ip = dynamic_runtime_params_slice.profile_conditions.Ip  # pylint: disable=invalid-name
   Ti_bound_right = jax_utils.error_if_not_positive(  # pylint: disable=invalid-name
@@ -838,28 +844,28 @@ def compute_boundary_conditions(
       dynamic_runtime_params_slice.plasma_composition.Zimp,
       dynamic_runtime_params_slice.plasma_composition.Zeff,
   )
-  return {
-      'temp_ion': dict(
+  return BoundaryConditions(
+      temp_ion=dict(
           left_face_grad_constraint=jnp.zeros(()),
           right_face_grad_constraint=None,
           right_face_constraint=jnp.array(Ti_bound_right),
       ),
-      'temp_el': dict(
+      temp_el=dict(
           left_face_grad_constraint=jnp.zeros(()),
           right_face_grad_constraint=None,
           right_face_constraint=jnp.array(Te_bound_right),
       ),
-      'ne': dict(
+      ne=dict(
           left_face_grad_constraint=jnp.zeros(()),
           right_face_grad_constraint=None,
           right_face_constraint=jnp.array(ne_bound_right),
       ),
-      'ni': dict(
+      ni=dict(
           left_face_grad_constraint=jnp.zeros(()),
           right_face_grad_constraint=None,
           right_face_constraint=jnp.array(ne_bound_right * dilution_factor),
       ),
-      'psi': dict(
+      psi=dict(
           right_face_grad_constraint=Ip
           * 1e6
           * constants.CONSTANTS.mu0
@@ -867,7 +873,7 @@ def compute_boundary_conditions(
           * geo.rmax,
           right_face_constraint=None,
       ),
-  }
+  )
 
 
 # pylint: disable=invalid-name
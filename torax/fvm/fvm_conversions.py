@@ -25,13 +25,16 @@ def cell_variable_tuple_to_vec(
 ) -> jax.Array:
   """Converts a tuple of CellVariables to a flat array.
 
+  All CellVariables are defined on the same mesh, so their values are stacked
+  and flattened rather than concatenated.
+
   Args:
     x_tuple: A tuple of CellVariables.
 
   Returns:
     A flat array of evolving state variables.
   """
-  x_vec = jnp.concatenate([x.value for x in x_tuple])
+  x_vec = jnp.stack([x.value for x in x_tuple]).reshape(-1)
   return x_vec
 
 
@@ -52,9 +55,9 @@ def vec_to_cell_variable_tuple(
   Returns:
     A tuple of updated CellVariables.
   """
-  x_split = jnp.split(x_vec, len(evolving_names))
+  x_split = x_vec.reshape((len(evolving_names), -1))
   x_out = [
-      dataclasses.replace(core_profiles[name], value=value)
-      for name, value in zip(evolving_names, x_split)
+      dataclasses.replace(core_profiles[name], value=x_split[i])
+      for i, name in enumerate(evolving_names)
   ]
   return tuple(x_out)
@@ -102,7 +102,7 @@ def implicit_solve_block(
 
   # Create updated CellVariable instances based on state_plus_dt which has
   # updated boundary conditions and prescribed profiles.
-  x_new = jnp.split(x_new, len(x_old))
+  x_new = x_new.reshape((len(x_old), -1))
   out = [
       dataclasses.replace(var, value=value)
       for var, value in zip(x_new_guess, x_new)
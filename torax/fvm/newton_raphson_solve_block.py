@@ -102,6 +102,7 @@ def newton_raphson_solve_block(
     delta_reduction_factor: float,
     tau_min: float,
     log_iterations: bool = False,
+    use_jacobian_free: bool = False,
 ) -> tuple[tuple[cell_variable.CellVariable, ...], int, AuxiliaryOutput]:
   # pyformat: disable  # pyformat removes line breaks needed for reability
   """Runs one time step of a Newton-Raphson based root-finding on the equation defined by `coeffs`.
@@ -121,6 +122,10 @@ def newton_raphson_solve_block(
 
   A*x_new = b, with A = jacobian(R(x_old)), b = A*x_old - R(x_old)
 
+  By default A is formed densely and the system is solved directly. With
+  use_jacobian_free, the system is instead solved for delta with GMRES, where
+  each product A*v is computed as a JVP of the residual and A is never formed.
+
   Each successive iteration sets x_new = x_old - delta, until the residual
   or delta is under a tolerance (tol).
   If either the delta step leads to an unphysical state, represented by NaNs in
@@ -170,6 +175,8 @@ def newton_raphson_solve_block(
       routine resets at a lower timestep.
     log_iterations: If true, output diagnostic information from within iteration
       loop.
+    use_jacobian_free: If true, compute the Newton step with a jacobian-free
+      Krylov solve instead of forming the dense jacobian.
 
   Returns:
     x_new: Tuple, with x_new[i] giving channel i of x at the next time step
@@ -235,8 +242,7 @@ def newton_raphson_solve_block(
   # The other arguments (dt, x_old, etc.) are fixed.
   # Note that core_profiles_t_plus_dt only contains the known quantities at
   # t_plus_dt, e.g. boundary conditions and prescribed profiles.
-  residual_fun = functools.partial(
-      residual_and_loss.theta_method_block_residual,
+  theta_method_block_fun_kwargs = dict(
       dt=dt,
       static_runtime_params_slice=static_runtime_params_slice,
       dynamic_runtime_params_slice_t_plus_dt=dynamic_runtime_params_slice_t_plus_dt,
@@ -249,32 +255,41 @@ def newton_raphson_solve_block(
       coeffs_old=coeffs_old,
       evolving_names=evolving_names,
   )
-  jacobian_fun = functools.partial(
-      residual_and_loss.theta_method_block_jacobian,
-      dt=dt,
-      static_runtime_params_slice=static_runtime_params_slice,
-      dynamic_runtime_params_slice_t_plus_dt=dynamic_runtime_params_slice_t_plus_dt,
-      geo=geo,
-      x_old=x_old,
-      core_profiles_t_plus_dt=core_profiles_t_plus_dt,
-      evolving_names=evolving_names,
-      transport_model=transport_model,
-      explicit_source_profiles=explicit_source_profiles,
-      source_models=source_models,
-      coeffs_old=coeffs_old,
+  residual_fun = functools.partial(
+      residual_and_loss.theta_method_block_residual,
+      **theta_method_block_fun_kwargs,
   )
+  if use_jacobian_free:
+    newton_step_fun = functools.partial(
+        residual_and_loss.theta_method_block_jacobian_free_step,
+        **theta_method_block_fun_kwargs,
+    )
+  else:
+    jacobian_fun = functools.partial(
+        residual_and_loss.theta_method_block_jacobian,
+        **theta_method_block_fun_kwargs,
+    )
+    newton_step_fun = functools.partial(
+        _dense_newton_step, jacobian_fun=jacobian_fun
+    )
 
   cond_fun = functools.partial(cond, tol=tol, tau_min=tau_min, maxiter=maxiter)
   delta_cond_fun = functools.partial(
       delta_cond,
       residual_fun=residual_fun,
+      tau_min=tau_min,
+  )
+  delta_body_fun = functools.partial(
+      delta_body,
+      delta_reduction_factor=delta_reduction_factor,
   )
   body_fun = functools.partial(
       body,
       residual_fun=residual_fun,
-      jacobian_fun=jacobian_fun,
+      newton_step_fun=newton_step_fun,
       delta_cond_fun=delta_cond_fun,
-      delta_reduction_factor=delta_reduction_factor,
+      delta_body_fun=delta_body_fun,
+      tau_min=tau_min,
       log_iterations=log_iterations,
   )
 
@@ -284,6 +299,7 @@ def newton_raphson_solve_block(
       'x': init_x_new_vec,
       'iterations': jnp.array(0),
       'residual': residual_vec_init_x_new,
+      'residual_scalar': residual_scalar(residual_vec_init_x_new),
       'last_tau': jnp.array(1.0),
       'aux_output': aux_output_init_x_new,
   }
@@ -291,7 +307,7 @@ def newton_raphson_solve_block(
   # log initial state if requested
   if log_iterations:
     _log_iterations(
-        residual=residual_scalar(initial_state['residual']),
+        residual=initial_state['residual_scalar'],
         iterations=initial_state['iterations'],
         dt=dt,
     )
@@ -313,10 +329,10 @@ def newton_raphson_solve_block(
   # tolerance (coarse_tol). Can occur when solver exits early due to small steps
   # in solution vicinity. Proceed but provide a warning to user.
   error = jax_utils.py_cond(
-      residual_scalar(output_state['residual']) < tol,
+      output_state['residual_scalar'] < tol,
       lambda: 0,  # Called when True
       lambda: jax_utils.py_cond(  # Called when False
-          residual_scalar(output_state['residual']) < coarse_tol,
+          output_state['residual_scalar'] < coarse_tol,
           lambda: 2,  # Called when True
           lambda: 1,  # Called when False
       ),
@@ -331,16 +347,16 @@ def residual_scalar(x):
 
 def cond(
     state: dict[str, jax.Array],
-    tau_min: float,
     maxiter: int,
     tol: float,
+    tau_min: float,
 ) -> bool:
   """Check if exit condition reached for Newton-Raphson iterations."""
   iteration = state['iterations'][...]
   return jnp.bool_(
       jnp.logical_and(
           jnp.logical_and(
-              residual_scalar(state['residual']) > tol, iteration < maxiter
+              state['residual_scalar'] > tol, iteration < maxiter
           ),
           state['last_tau'] > tau_min,
       )
@@ -350,20 +366,14 @@ def cond(
 def body(
     input_state: dict[str, jax.Array],
     residual_fun,
-    jacobian_fun,
+    newton_step_fun,
     delta_cond_fun,
-    delta_reduction_factor,
+    delta_body_fun,
+    tau_min,
     log_iterations,
 ) -> dict[str, jax.Array]:
   """Calculates next guess in Newton-Raphson iteration."""
 
-  delta_body_fun = functools.partial(
-      delta_body,
-      delta_reduction_factor=delta_reduction_factor,
-  )
-
-  a_mat, _ = jacobian_fun(input_state['x'])  # Ignore the aux output here.
-  rhs = -input_state['residual']
   # delta = x_new - x_old
   # tau = delta/delta0, where delta0 is the delta that sets the linearized
   # residual to zero. tau < 1 when needed such that x_new meets
@@ -373,8 +383,10 @@ def body(
 
   initial_delta_state = {
       'x': input_state['x'],
-      'delta': jnp.linalg.solve(a_mat, rhs),
+      'delta': newton_step_fun(input_state['x'], input_state['residual']),
       'tau': jnp.array(1.0),
+      # x is fixed during the delta loop, so its residual is computed once.
+      'residual_scalar_x_old': input_state['residual_scalar'],
   }
   output_delta_state = jax_utils.py_while(
       delta_cond_fun, delta_body_fun, initial_delta_state
@@ -382,16 +394,43 @@ def body(
 
   x_new_vec = input_state['x'] + output_delta_state['delta']
   residual_vec_x_new, aux_output_x_new = residual_fun(x_new_vec)
+  residual_scalar_x_new = residual_scalar(residual_vec_x_new)
+  # If the delta loop stopped at tau_min without finding a valid step, keep x
+  # unchanged. The outer loop then exits since tau is below tau_min.
+  step_rejected = jnp.logical_and(
+      output_delta_state['tau'] <= tau_min,
+      jnp.logical_not(
+          residual_scalar_x_new <= output_delta_state['residual_scalar_x_old']
+      ),
+  )
+  x_new_vec, residual_vec_x_new, residual_scalar_x_new, aux_output_x_new = (
+      jax_utils.py_cond(
+          step_rejected,
+          lambda: (
+              input_state['x'],
+              input_state['residual'],
+              input_state['residual_scalar'],
+              input_state['aux_output'],
+          ),
+          lambda: (
+              x_new_vec,
+              residual_vec_x_new,
+              residual_scalar_x_new,
+              aux_output_x_new,
+          ),
+      )
+  )
   output_state = {
       'x': x_new_vec,
       'residual': residual_vec_x_new,
+      'residual_scalar': residual_scalar_x_new,
       'iterations': jnp.array(input_state['iterations'][...]) + 1,
       'last_tau': output_delta_state['tau'],
       'aux_output': aux_output_x_new,
   }
   if log_iterations:
     _log_iterations(
-        residual=residual_scalar(output_state['residual']),
+        residual=output_state['residual_scalar'],
         iterations=output_state['iterations'],
         delta_reduction=output_delta_state['tau'],
     )
@@ -399,38 +438,66 @@ def body(
   return output_state
 
 
+def _dense_newton_step(
+    x_vec: jax.Array,
+    residual_vec: jax.Array,
+    jacobian_fun: Callable[[jax.Array], tuple[jax.Array, AuxiliaryOutput]],
+) -> jax.Array:
+  """Solves for the Newton step using the dense jacobian of the residual."""
+  a_mat, _ = jacobian_fun(x_vec)  # Ignore the aux output here.
+  # jnp.linalg.solve is implemented with lax.custom_linear_solve, so its
+  # derivatives reuse the LU factorization (one extra transposed solve) rather
+  # than differentiating through the factorization.
+  return jnp.linalg.solve(a_mat, -residual_vec)
+
+
 def delta_cond(
     delta_state: dict[str, jax.Array],
     residual_fun: Callable[[jax.Array], jax.Array],
+    tau_min: float,
 ) -> bool:
   """Check if delta obtained from Newton step is valid.
 
+  The delta loop is bounded by tau_min: once tau drops below it, the outer
+  Newton-Raphson loop exits after this iteration, so reducing delta further
+  would only waste residual evaluations. This bounds the number of delta
+  iterations by ceil(log(tau_min) / log(delta_reduction_factor)).
+
   Args:
     delta_state: see `delta_body`.
     residual_fun: Residual function.
+    tau_min: Minimum delta/delta_original allowed before the newton raphson
+      routine resets at a lower timestep.
 
   Returns:
-    True if the new value of `x` causes any NaNs or has increased the residual
-    relative to the old value of `x`.
+    True if tau is above tau_min and the new value of `x` causes any NaNs or
+    has increased the residual relative to the old value of `x`.
   """
   x_old = delta_state['x']
   x_new = x_old + delta_state['delta']
-  residual_vec_x_old, _ = residual_fun(x_old)
-  residual_scalar_x_old = residual_scalar(residual_vec_x_old)
-  # Avoid sanity checking inside residual, since we directly
-  # afterwards check sanity on the output (NaN checking)
-  # TODO(b/312453092) consider instead sanity-checking x_new
-  with jax_utils.enable_errors(False):
-    residual_vec_x_new, _ = residual_fun(x_new)
-    residual_scalar_x_new = residual_scalar(residual_vec_x_new)
-  return jnp.bool_(
-      jnp.logical_and(
-          jnp.max(delta_state['delta']) > MIN_DELTA,
-          jnp.logical_or(
-              residual_scalar_x_old < residual_scalar_x_new,
-              jnp.isnan(residual_scalar_x_new),
-          ),
-      ),
+  residual_scalar_x_old = delta_state['residual_scalar_x_old']
+
+  def residual_increased():
+    # Avoid sanity checking inside residual, since we directly
+    # afterwards check sanity on the output (NaN checking)
+    # TODO(b/312453092) consider instead sanity-checking x_new
+    with jax_utils.enable_errors(False):
+      residual_vec_x_new, _ = residual_fun(x_new)
+      residual_scalar_x_new = residual_scalar(residual_vec_x_new)
+    return jnp.bool_(
+        jnp.logical_and(
+            jnp.max(jnp.abs(delta_state['delta'])) > MIN_DELTA,
+            jnp.logical_or(
+                residual_scalar_x_old < residual_scalar_x_new,
+                jnp.isnan(residual_scalar_x_new),
+            ),
+        ),
+    )
+
+  return jax_utils.py_cond(
+      delta_state['tau'] > tau_min,
+      residual_increased,
+      lambda: jnp.bool_(False),
   )
 
 
@@ -442,5 +509,6 @@ def delta_body(
       'x': input_delta_state['x'],
       'delta': input_delta_state['delta'] * delta_reduction_factor,
       'tau': jnp.array(input_delta_state['tau'][...]) * delta_reduction_factor,
+      'residual_scalar_x_old': input_delta_state['residual_scalar_x_old'],
   }
   return output_delta_state
@@ -20,6 +20,7 @@ Residual functions are for use with e.g. the Newton-Raphson method
 while loss functions can be minimized using any optimization method.
 """
 import functools
+from typing import Callable
 import chex
 import jax
 from jax import numpy as jnp
@@ -28,6 +29,7 @@ from torax import calc_coeffs
 from torax import core_profile_setters
 from torax import geometry
 from torax import jax_utils
+from torax import math_utils
 from torax import state
 from torax.config import runtime_params_slice
 from torax.fvm import block_1d_coeffs
@@ -42,6 +44,11 @@ AuxiliaryOutput = block_1d_coeffs.AuxiliaryOutput
 Block1DCoeffs = block_1d_coeffs.Block1DCoeffs
 Block1DCoeffsCallback = block_1d_coeffs.Block1DCoeffsCallback
 
+# Settings of the GMRES solve used by the jacobian-free Newton step.
+_GMRES_TOL = 1e-8
+_GMRES_RESTART = 20
+_GMRES_MAXITER = 50
+
 
 @functools.partial(
     jax_utils.jit,
@@ -239,7 +246,7 @@ def theta_method_block_residual(
   Returns:
     residual: Vector residual between LHS and RHS of the theta method equation.
   """
-  x_old_vec = jnp.concatenate([var.value for var in x_old])
+  x_old_vec = fvm_conversions.cell_variable_tuple_to_vec(x_old)
   # Create updated CellVariable instances based on core_profiles_t_plus_dt which
   # has updated boundary conditions and prescribed profiles.
   x_new_guess = fvm_conversions.vec_to_cell_variable_tuple(
@@ -274,8 +281,16 @@ def theta_method_block_residual(
       convection_neumann_mode=static_runtime_params_slice.stepper.convection_neumann_mode,
   )
 
-  lhs = jnp.dot(lhs_mat, x_new_guess_vec) + lhs_vec
-  rhs = jnp.dot(rhs_mat, x_old_vec) + rhs_vec
+  # Request full precision for the products, since accelerators may otherwise
+  # use reduced precision passes for matmuls (e.g. when running in f32).
+  lhs = (
+      jnp.dot(lhs_mat, x_new_guess_vec, precision=jax.lax.Precision.HIGHEST)
+      + lhs_vec
+  )
+  rhs = (
+      jnp.dot(rhs_mat, x_old_vec, precision=jax.lax.Precision.HIGHEST)
+      + rhs_vec
+  )
 
   residual = lhs - rhs
   return residual, coeffs_new.auxiliary_outputs
@@ -295,6 +310,155 @@ theta_method_block_jacobian = jax_utils.jit(
 )
 
 
+@functools.partial(
+    jax_utils.jit,
+    static_argnames=[
+        'static_runtime_params_slice',
+        'transport_model',
+        'source_models',
+        'evolving_names',
+    ],
+)
+def theta_method_block_jacobian_free_step(
+    x_new_guess_vec: jax.Array,
+    residual_vec: jax.Array,
+    dt: jax.Array,
+    static_runtime_params_slice: runtime_params_slice.StaticRuntimeParamsSlice,
+    dynamic_runtime_params_slice_t_plus_dt: runtime_params_slice.DynamicRuntimeParamsSlice,
+    geo: geometry.Geometry,
+    x_old: tuple[cell_variable.CellVariable, ...],
+    core_profiles_t_plus_dt: state.CoreProfiles,
+    transport_model: transport_model_lib.TransportModel,
+    explicit_source_profiles: source_profiles.SourceProfiles,
+    source_models: source_models_lib.SourceModels,
+    coeffs_old: Block1DCoeffs,
+    evolving_names: tuple[str, ...],
+) -> jax.Array:
+  """Newton step for the theta-method residual, without forming the jacobian.
+
+  Solves jacobian(R(x_new_guess)) * delta = -R(x_new_guess) with GMRES. Each
+  jacobian-vector product is computed from a linearization of the residual,
+  so the dense jacobian is never materialized.
+
+  GMRES is preconditioned with the block-tridiagonal part of the jacobian,
+  coupling all channels within a cell and its neighbouring cells, which
+  captures the finite volume stencil. It is extracted with a few JVPs and
+  inverted with the block Thomas algorithm. The full jacobian is generally not
+  block-tridiagonal (e.g. due to sources depending on volume integrals), so it
+  is only used as a preconditioner.
+
+  Args:
+    x_new_guess_vec: Flattened array of current guess of x_new for all evolving
+      core profiles.
+    residual_vec: The residual evaluated at x_new_guess_vec.
+    dt: Time step duration.
+    static_runtime_params_slice: Static runtime parameters. Changes to these
+      runtime params will trigger recompilation.
+    dynamic_runtime_params_slice_t_plus_dt: Runtime parameters for time t + dt.
+    geo: Geometry object.
+    x_old: The starting x defined as a tuple of CellVariables.
+    core_profiles_t_plus_dt: Core plasma profiles which contain all available
+      prescribed quantities at the end of the time step. This includes evolving
+      boundary conditions and prescribed time-dependent profiles that are not
+      being evolved by the PDE system.
+    transport_model: Turbulent transport model callable.
+    explicit_source_profiles: Pre-calculated sources implemented as explicit
+      sources in the PDE.
+    source_models: Collection of source callables to generate source PDE
+      coefficients.
+    coeffs_old: The coefficients calculated at x_old.
+    evolving_names: The names of variables within the core profiles that should
+      evolve.
+
+  Returns:
+    delta: The Newton step, i.e. x_new_guess_vec + delta zeroes the linearized
+      residual.
+  """
+
+  def residual_fun(x_new_guess_vec: jax.Array) -> jax.Array:
+    residual, _ = theta_method_block_residual(
+        x_new_guess_vec=x_new_guess_vec,
+        dt=dt,
+        static_runtime_params_slice=static_runtime_params_slice,
+        dynamic_runtime_params_slice_t_plus_dt=dynamic_runtime_params_slice_t_plus_dt,
+        geo=geo,
+        x_old=x_old,
+        core_profiles_t_plus_dt=core_profiles_t_plus_dt,
+        transport_model=transport_model,
+        explicit_source_profiles=explicit_source_profiles,
+        source_models=source_models,
+        coeffs_old=coeffs_old,
+        evolving_names=evolving_names,
+    )
+    return residual
+
+  # Linearize once so that the residual's forward pass is not recomputed for
+  # every jacobian-vector product.
+  _, matvec = jax.linearize(residual_fun, x_new_guess_vec)
+  num_channels = len(evolving_names)
+  num_cells = x_new_guess_vec.shape[0] // num_channels
+  lower, diag, upper = _block_tridiagonal_part(
+      matvec, num_channels, num_cells, x_new_guess_vec.dtype
+  )
+
+  def preconditioner(vec: jax.Array) -> jax.Array:
+    rhs = vec.reshape((num_channels, num_cells)).T
+    x = math_utils.block_tridiagonal_solve(lower, diag, upper, rhs)
+    return x.T.ravel()
+
+  delta, _ = jax.scipy.sparse.linalg.gmres(
+      matvec,
+      -residual_vec,
+      tol=_GMRES_TOL,
+      restart=_GMRES_RESTART,
+      maxiter=_GMRES_MAXITER,
+      M=preconditioner,
+  )
+  return delta
+
+
+def _block_tridiagonal_part(
+    matvec: Callable[[jax.Array], jax.Array],
+    num_channels: int,
+    num_cells: int,
+    dtype: jnp.dtype,
+) -> tuple[jax.Array, jax.Array, jax.Array]:
+  """Extracts the block-tridiagonal part of a jacobian given its JVP.
+
+  The state vector is ordered channel by channel. Cells are grouped by their
+  index modulo 3 so that within a group no two cells share a neighbour, and
+  each (group, channel) pair is probed with a single JVP. This takes
+  3 * num_channels JVPs and is exact if the jacobian is block-tridiagonal.
+
+  Args:
+    matvec: Computes the product of the jacobian with a vector.
+    num_channels: Number of evolving channels.
+    num_cells: Number of cells per channel.
+    dtype: Dtype of the state vector.
+
+  Returns:
+    (lower, diag, upper): The blocks coupling each cell to the previous cell,
+      itself, and the next cell, each of shape (num_cells, num_channels,
+      num_channels) and indexed as [cell, output channel, input channel].
+  """
+  cells = jnp.arange(num_cells)
+  # tangents[group, channel] selects all cells in group for the given channel.
+  group_mask = (cells % 3 == jnp.arange(3)[:, None]).astype(dtype)
+  tangents = jnp.einsum(
+      'gj,cd->gcdj', group_mask, jnp.eye(num_channels, dtype=dtype)
+  ).reshape((3 * num_channels, num_channels * num_cells))
+  # probes[group, input channel, output channel, cell]
+  probes = jax.vmap(matvec)(tangents).reshape(
+      (3, num_channels, num_channels, num_cells)
+  )
+  # Row i of a block only sees column i + offset from the group containing it.
+  probes = jnp.transpose(probes, (3, 0, 2, 1))
+  lower = probes[cells, (cells - 1) % 3]
+  diag = probes[cells, cells % 3]
+  upper = probes[cells, (cells + 1) % 3]
+  return lower, diag, upper
+
+
 @functools.partial(
     jax_utils.jit,
     static_argnames=[
@@ -15,6 +15,7 @@
 """Unit tests for torax.fvm."""
 import copy
 import dataclasses
+import functools
 from typing import Callable
 from absl.testing import absltest
 from absl.testing import parameterized
@@ -28,6 +29,7 @@ from torax import geometry
 from torax.config import runtime_params as general_runtime_params
 from torax.config import runtime_params_slice
 from torax.fvm import implicit_solve_block
+from torax.fvm import newton_raphson_solve_block
 from torax.fvm import residual_and_loss
 from torax.sources import default_sources
 from torax.sources import runtime_params as source_runtime_params
@@ -479,6 +481,143 @@ class FVMTest(torax_refs.ReferenceValueTest):
       np.testing.assert_allclose(loss, 0.0, atol=1e-7)
       np.testing.assert_allclose(residual, 0.0, atol=1e-7)
 
+  def test_jacobian_free_step_matches_dense_step(self):
+    """Tests the jacobian-free Newton step against a dense jacobian solve."""
+    runtime_params = general_runtime_params.GeneralRuntimeParams(
+        profile_conditions=general_runtime_params.ProfileConditions(
+            set_pedestal=False,
+        ),
+    )
+    stepper_params = stepper_runtime_params.RuntimeParams(
+        predictor_corrector=False,
+        theta_imp=1.0,
+    )
+    geo = geometry.build_circular_geometry(nr=4)
+    transport_model_builder = (
+        constant_transport_model.ConstantTransportModelBuilder()
+    )
+    transport_model = transport_model_builder()
+    source_models = default_sources.get_default_sources()
+    dynamic_runtime_params_slice = (
+        runtime_params_slice.build_dynamic_runtime_params_slice(
+            runtime_params,
+            transport=transport_model_builder.runtime_params,
+            sources=source_models.runtime_params,
+            stepper=stepper_params,
+        )
+    )
+    static_runtime_params_slice = (
+        runtime_params_slice.build_static_runtime_params_slice(
+            runtime_params, stepper=stepper_params
+        )
+    )
+    core_profiles = core_profile_setters.initial_core_profiles(
+        dynamic_runtime_params_slice,
+        geo,
+        source_models,
+    )
+    evolving_names = ('temp_ion', 'temp_el')
+    explicit_source_profiles = source_models_lib.build_source_profiles(
+        source_models=source_models,
+        dynamic_runtime_params_slice=dynamic_runtime_params_slice,
+        geo=geo,
+        core_profiles=core_profiles,
+        explicit=True,
+    )
+    coeffs = calc_coeffs.calc_coeffs(
+        static_runtime_params_slice=static_runtime_params_slice,
+        dynamic_runtime_params_slice=dynamic_runtime_params_slice,
+        geo=geo,
+        core_profiles=core_profiles,
+        transport_model=transport_model,
+        explicit_source_profiles=explicit_source_profiles,
+        source_models=source_models,
+        evolving_names=evolving_names,
+        use_pereverzev=False,
+    )
+    x_old = tuple(core_profiles[name] for name in evolving_names)
+    x_new_guess_vec = 1.1 * jnp.concatenate([var.value for var in x_old])
+    kwargs = dict(
+        dt=jnp.array(0.2),
+        static_runtime_params_slice=static_runtime_params_slice,
+        dynamic_runtime_params_slice_t_plus_dt=dynamic_runtime_params_slice,
+        geo=geo,
+        x_old=x_old,
+        core_profiles_t_plus_dt=core_profiles,
+        transport_model=transport_model,
+        explicit_source_profiles=explicit_source_profiles,
+        source_models=source_models,
+        coeffs_old=coeffs,
+        evolving_names=evolving_names,
+    )
+
+    residual, _ = residual_and_loss.theta_method_block_residual(
+        x_new_guess_vec, **kwargs
+    )
+    jacobian, _ = residual_and_loss.theta_method_block_jacobian(
+        x_new_guess_vec, **kwargs
+    )
+    delta = residual_and_loss.theta_method_block_jacobian_free_step(
+        x_new_guess_vec, residual, **kwargs
+    )
+
+    np.testing.assert_allclose(
+        delta, jnp.linalg.solve(jacobian, -residual), rtol=1e-6
+    )
+
+  def test_newton_raphson_step_rejected_below_tau_min(self):
+    """Tests that x is unchanged if the delta loop reaches tau_min."""
+    tau_min = 0.01
+    delta_reduction_factor = 0.5
+    x = jnp.array([1.0, 2.0, 3.0])
+
+    def residual_fun(x):
+      return x, None
+
+    # A step along +x always increases the residual, so no tau is accepted.
+    def newton_step_fun(x, residual):
+      del residual
+      return jnp.ones_like(x)
+
+    input_state = {
+        'x': x,
+        'residual': residual_fun(x)[0],
+        'residual_scalar': newton_raphson_solve_block.residual_scalar(x),
+        'iterations': jnp.array(0),
+        'aux_output': None,
+    }
+    output_state = newton_raphson_solve_block.body(
+        input_state,
+        residual_fun=residual_fun,
+        newton_step_fun=newton_step_fun,
+        delta_cond_fun=functools.partial(
+            newton_raphson_solve_block.delta_cond,
+            residual_fun=residual_fun,
+            tau_min=tau_min,
+        ),
+        delta_body_fun=functools.partial(
+            newton_raphson_solve_block.delta_body,
+            delta_reduction_factor=delta_reduction_factor,
+        ),
+        tau_min=tau_min,
+        log_iterations=False,
+    )
+
+    np.testing.assert_array_equal(output_state['x'], x)
+    np.testing.assert_array_equal(
+        output_state['residual_scalar'], input_state['residual_scalar']
+    )
+    self.assertLessEqual(output_state['last_tau'], tau_min)
+    # The delta loop stops at the first tau below tau_min.
+    self.assertGreater(
+        output_state['last_tau'], tau_min * delta_reduction_factor
+    )
+    self.assertFalse(
+        newton_raphson_solve_block.cond(
+            output_state, maxiter=10, tol=1e-5, tau_min=tau_min
+        )
+    )
+
   def test_implicit_solve_block_uses_updated_boundary_conditions(self):
     """Tests that updated boundary conditions affect x_new."""
     # Create a system with diffusive transport and no sources. When initialized
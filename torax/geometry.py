@@ -514,11 +514,9 @@ def build_chease_geometry(
   # needed because CHEASE psi profile has noisy second derivatives
   dpsidrho = Ip_chease[1:] * constants.CONSTANTS.mu0 / G2_chease[1:]
   dpsidrho = jnp.concatenate((jnp.zeros(1), dpsidrho))
-  psi_from_Ip = jnp.zeros(len(psi))
-  for i in range(1, len(psi_from_Ip) + 1):
-    psi_from_Ip = psi_from_Ip.at[i - 1].set(
-        jax.scipy.integrate.trapezoid(dpsidrho[:i], rho[:i])
-    )
+  psi_from_Ip = math_utils.cumulative_trapezoid(
+      x=rho, y=dpsidrho, initial=jnp.zeros(())
+  )
   # set Ip-consistent psi derivative boundary condition (although will be
   # replaced later with an fvm constraint)
   psi_from_Ip = psi_from_Ip.at[-1].set(
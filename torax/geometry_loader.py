@@ -14,29 +14,40 @@
 
 """File I/O for loading geometry files."""
 
+import functools
+
 import jax.numpy as jnp
+import numpy as np
 
 
 def initialize_CHEASE_dict(  # pylint: disable=invalid-name
     file_path: str,
 ) -> dict[str, jnp.ndarray]:
-  """Loads the data from a CHEASE file into a dictionary."""
-  # pyformat: disable
-  with open(file_path, 'r') as file:
-  # pyformat: enable
-    chease_data = {}
-    var_labels = file.readline().strip().split()[1:]  # ignore % comment column
+  """Loads the data from a CHEASE file into a dictionary.
+
+  Files are parsed once per process; later loads of the same file reuse the
+  parsed arrays.
+
+  Args:
+    file_path: Path to the CHEASE file.
 
-    for var_label in var_labels:
-      chease_data[var_label] = []
+  Returns:
+    Mapping from CHEASE variable labels to their profiles.
+  """
+  return dict(_load_CHEASE_file(file_path))
 
-    # store data in respective keys
-    for line in file:
-      values = line.strip().split()
-      for var_label, value in zip(var_labels, values):
-        chease_data[var_label].append(float(value))
 
-  # Convert lists to jax arrays.
+@functools.lru_cache(maxsize=4)
+def _load_CHEASE_file(  # pylint: disable=invalid-name
+    file_path: str,
+) -> dict[str, jnp.ndarray]:
+  """Parses a CHEASE file. Cached, so callers must not mutate the result."""
+  with open(file_path, 'r') as file:
+    var_labels = file.readline().strip().split()[1:]  # ignore % comment column
+    # Parse all the data rows in one vectorized pass, one column per label.
+    chease_data = np.loadtxt(file, ndmin=2)
+
   return {
-      var_label: jnp.array(chease_data[var_label]) for var_label in chease_data
+      var_label: jnp.array(chease_data[:, i])
+      for i, var_label in enumerate(var_labels)
   }
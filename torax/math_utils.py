@@ -18,6 +18,7 @@ Math operations that are needed for Torax, but are not specific to plasma
 physics or differential equation solvers.
 """
 from typing import Optional
+import jax
 from jax import numpy as jnp
 
 
@@ -38,6 +39,54 @@ def tridiag(
   return jnp.diag(diag) + jnp.diag(above, 1) + jnp.diag(below, -1)
 
 
+def block_tridiagonal_solve(
+    lower: jnp.ndarray,
+    diag: jnp.ndarray,
+    upper: jnp.ndarray,
+    rhs: jnp.ndarray,
+) -> jnp.ndarray:
+  """Solves a block-tridiagonal linear system with the block Thomas algorithm.
+
+  Row i of the system reads
+  lower[i] @ x[i - 1] + diag[i] @ x[i] + upper[i] @ x[i + 1] = rhs[i],
+  so lower[0] and upper[-1] are ignored.
+
+  Args:
+    lower: Blocks below the diagonal, shape (n, m, m).
+    diag: Diagonal blocks, shape (n, m, m).
+    upper: Blocks above the diagonal, shape (n, m, m).
+    rhs: Right hand side, shape (n, m).
+
+  Returns:
+    x: Solution of the system, shape (n, m).
+  """
+  lower = lower.at[0].set(0.0)
+  upper = upper.at[-1].set(0.0)
+
+  def forward(carry, row):
+    upper_prev, rhs_prev = carry
+    lower_i, diag_i, upper_i, rhs_i = row
+    denom = diag_i - lower_i @ upper_prev
+    upper_i = jnp.linalg.solve(denom, upper_i)
+    rhs_i = jnp.linalg.solve(denom, rhs_i - lower_i @ rhs_prev)
+    return (upper_i, rhs_i), (upper_i, rhs_i)
+
+  init = (jnp.zeros_like(diag[0]), jnp.zeros_like(rhs[0]))
+  _, (upper_mod, rhs_mod) = jax.lax.scan(
+      forward, init, (lower, diag, upper, rhs)
+  )
+
+  def backward(x_next, row):
+    upper_i, rhs_i = row
+    x_i = rhs_i - upper_i @ x_next
+    return x_i, x_i
+
+  _, x = jax.lax.scan(
+      backward, jnp.zeros_like(rhs[0]), (upper_mod, rhs_mod), reverse=True
+  )
+  return x
+
+
 def cumulative_trapezoid(
     x: jnp.ndarray, y: jnp.ndarray, initial: Optional[jnp.ndarray] = None
 ) -> jnp.ndarray:
@@ -1137,25 +1137,25 @@ def provide_core_profiles_t_plus_dt(
   temp_ion = dataclasses.replace(
       core_profiles_t.temp_ion,
       value=updated_values['temp_ion'],
-      **updated_boundary_conditions['temp_ion'],
+      **updated_boundary_conditions.temp_ion,
   )
   temp_el = dataclasses.replace(
       core_profiles_t.temp_el,
       value=updated_values['temp_el'],
-      **updated_boundary_conditions['temp_el'],
+      **updated_boundary_conditions.temp_el,
   )
   psi = dataclasses.replace(
-      core_profiles_t.psi, **updated_boundary_conditions['psi']
+      core_profiles_t.psi, **updated_boundary_conditions.psi
   )
   ne = dataclasses.replace(
       core_profiles_t.ne,
       value=updated_values['ne'],
-      **updated_boundary_conditions['ne'],
+      **updated_boundary_conditions.ne,
   )
   ni = dataclasses.replace(
       core_profiles_t.ni,
       value=updated_values['ni'],
-      **updated_boundary_conditions['ni'],
+      **updated_boundary_conditions.ni,
   )
   core_profiles_t_plus_dt = dataclasses.replace(
       core_profiles_t, temp_ion=temp_ion, temp_el=temp_el, psi=psi, ne=ne, ni=ni
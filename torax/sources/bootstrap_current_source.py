@@ -34,7 +34,7 @@ from torax.sources import source
 from torax.sources import source_profiles
 
 
-@dataclasses.dataclass(kw_only=True)
+@dataclasses.dataclass(kw_only=True, slots=True)
 class RuntimeParams(runtime_params_lib.RuntimeParams):
   # Multiplication factor for bootstrap current
   bootstrap_mult: float = 1.0
@@ -32,7 +32,7 @@ from torax.sources import source
 # pylint: disable=invalid-name
 
 
-@dataclasses.dataclass(kw_only=True)
+@dataclasses.dataclass(kw_only=True, slots=True)
 class GasPuffRuntimeParams(runtime_params_lib.RuntimeParams):
   # exponential decay length of gas puff ionization [normalized radial coord]
   puff_decay_length: runtime_params_lib.TimeDependentField = 0.05
@@ -90,7 +90,7 @@ class GasPuffSource(source.SingleProfileNeSource):
   formula: source.SourceProfileFunction = _calc_puff_source
 
 
-@dataclasses.dataclass(kw_only=True)
+@dataclasses.dataclass(kw_only=True, slots=True)
 class NBIParticleRuntimeParams(runtime_params_lib.RuntimeParams):
   """Runtime parameters for NBI particle source."""
 
@@ -154,7 +154,7 @@ class NBIParticleSource(source.SingleProfileNeSource):
   formula: source.SourceProfileFunction = _calc_nbi_source
 
 
-@dataclasses.dataclass(kw_only=True)
+@dataclasses.dataclass(kw_only=True, slots=True)
 class PelletRuntimeParams(runtime_params_lib.RuntimeParams):
   """Runtime parameters for PelletSource."""
 
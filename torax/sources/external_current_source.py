@@ -33,7 +33,7 @@ from torax.sources import source
 # pylint: disable=invalid-name
 
 
-@dataclasses.dataclass(kw_only=True)
+@dataclasses.dataclass(kw_only=True, slots=True)
 class RuntimeParams(runtime_params_lib.RuntimeParams):
   """Runtime parameters for the external current source."""
 
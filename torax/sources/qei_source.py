@@ -34,7 +34,7 @@ from torax.sources import source_profiles
 # pylint: disable=invalid-name
 
 
-@dataclasses.dataclass(kw_only=True)
+@dataclasses.dataclass(kw_only=True, slots=True)
 class RuntimeParams(runtime_params_lib.RuntimeParams):
   # multiplier for ion-electron heat exchange term for sensitivity testing
   Qei_mult: float = 1.0
@@ -46,7 +46,7 @@ class Mode(enum.Enum):
   FORMULA_BASED = 2
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class RuntimeParams:
   """Configures a single source/sink term.
 
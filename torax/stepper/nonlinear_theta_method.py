@@ -129,7 +129,7 @@ class NonlinearThetaMethod(stepper.Stepper):
     ...
 
 
-@dataclasses.dataclass(kw_only=True)
+@dataclasses.dataclass(kw_only=True, slots=True)
 class OptimizerRuntimeParams(runtime_params_lib.RuntimeParams):
   """Runtime parameters used inside the OptimizerThetaMethod stepper."""
 
@@ -244,7 +244,7 @@ class OptimizerThetaMethodBuilder(stepper.StepperBuilder):
     return self.builder(transport_model, source_models)
 
 
-@dataclasses.dataclass(kw_only=True)
+@dataclasses.dataclass(kw_only=True, slots=True)
 class NewtonRaphsonRuntimeParams(runtime_params_lib.RuntimeParams):
   """Runtime parameters used inside the NewtonRaphsonThetaMethod stepper."""
 
@@ -256,6 +256,9 @@ class NewtonRaphsonRuntimeParams(runtime_params_lib.RuntimeParams):
   coarse_tol: float = 1e-2
   delta_reduction_factor: float = 0.5
   tau_min: float = 0.01
+  # If True, solve for each Newton step with a jacobian-free Krylov method
+  # instead of forming the dense jacobian.
+  use_jacobian_free: bool = False
 
   def build_dynamic_params(
       self, t: chex.Numeric
@@ -280,6 +283,7 @@ class DynamicNewtonRaphsonRuntimeParams(
   coarse_tol: float
   delta_reduction_factor: float
   tau_min: float
+  use_jacobian_free: bool
 
 
 class NewtonRaphsonThetaMethod(NonlinearThetaMethod):
@@ -338,6 +342,7 @@ class NewtonRaphsonThetaMethod(NonlinearThetaMethod):
             coarse_tol=stepper_params.coarse_tol,
             delta_reduction_factor=stepper_params.delta_reduction_factor,
             tau_min=stepper_params.tau_min,
+            use_jacobian_free=stepper_params.use_jacobian_free,
         )
     )
     return x_new, core_sources, core_transport, error
@@ -30,7 +30,7 @@ from torax.config import config_args
 TimeDependentField = interpolated_param.InterpParamOrInterpParamInput
 
 
-@dataclasses.dataclass(kw_only=True)
+@dataclasses.dataclass(kw_only=True, slots=True)
 class RuntimeParams:
   """Runtime parameters used inside the stepper objects.
 
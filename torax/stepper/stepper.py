@@ -19,6 +19,7 @@ Abstract base class defining updates to State.
 
 import abc
 import dataclasses
+import itertools
 
 import jax
 from torax import core_profile_setters
@@ -31,6 +32,18 @@ from torax.sources import source_profiles
 from torax.stepper import runtime_params as runtime_params_lib
 from torax.transport_model import transport_model as transport_model_lib
 
+# Names of the core profiles which can be evolved, in solver order.
+_EVOLVABLE_NAMES = ('temp_ion', 'temp_el', 'psi', 'ne')
+
+# The names of the evolving core profiles, keyed by the static
+# (ion_heat_eq, el_heat_eq, current_eq, dens_eq) runtime params.
+_EVOLVING_NAMES = {
+    equations: tuple(
+        name for name, eq in zip(_EVOLVABLE_NAMES, equations) if eq
+    )
+    for equations in itertools.product((False, True), repeat=4)
+}
+
 
 class Stepper(abc.ABC):
   """Calculates a single time step's update to State.
@@ -112,16 +125,12 @@ class Stepper(abc.ABC):
     # most can make use of the boilerplate here and just implement `_x_new`.
 
     # Use runtime params to determine which variables to evolve
-    evolving_names = []
-    if static_runtime_params_slice.ion_heat_eq:
-      evolving_names.append('temp_ion')
-    if static_runtime_params_slice.el_heat_eq:
-      evolving_names.append('temp_el')
-    if static_runtime_params_slice.current_eq:
-      evolving_names.append('psi')
-    if static_runtime_params_slice.dens_eq:
-      evolving_names.append('ne')
-    evolving_names = tuple(evolving_names)
+    evolving_names = _EVOLVING_NAMES[(
+        static_runtime_params_slice.ion_heat_eq,
+        static_runtime_params_slice.el_heat_eq,
+        static_runtime_params_slice.current_eq,
+        static_runtime_params_slice.dens_eq,
+    )]
 
     # Don't call solver functions on an empty list
     if evolving_names:
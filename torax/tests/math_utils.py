@@ -49,6 +49,34 @@ class HeatTransportTest(parameterized.TestCase):
 
     np.testing.assert_allclose(cumulative, ref)
 
+  def test_block_tridiagonal_solve(self):
+    """Test that block_tridiagonal_solve matches a dense solve."""
+    num_blocks, block_size = 6, 3
+    rng_lower, rng_diag, rng_upper, rng_rhs = jax.random.split(
+        jax.random.PRNGKey(20240611), 4
+    )
+    shape = (num_blocks, block_size, block_size)
+    lower = jax.random.normal(rng_lower, shape)
+    # Make the system diagonally dominant so that it is well conditioned.
+    diag = jax.random.normal(rng_diag, shape) + 10 * np.eye(block_size)
+    upper = jax.random.normal(rng_upper, shape)
+    rhs = jax.random.normal(rng_rhs, (num_blocks, block_size))
+
+    dense = np.zeros((num_blocks * block_size, num_blocks * block_size))
+    for i in range(num_blocks):
+      rows = slice(i * block_size, (i + 1) * block_size)
+      dense[rows, rows] = diag[i]
+      if i > 0:
+        dense[rows, (i - 1) * block_size : i * block_size] = lower[i]
+      if i < num_blocks - 1:
+        dense[rows, (i + 1) * block_size : (i + 2) * block_size] = upper[i]
+
+    x = math_utils.block_tridiagonal_solve(lower, diag, upper, rhs)
+
+    np.testing.assert_allclose(
+        x.flatten(), np.linalg.solve(dense, rhs.flatten()), rtol=1e-6
+    )
+
 
 if __name__ == '__main__':
   absltest.main()
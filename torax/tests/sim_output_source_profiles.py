@@ -20,10 +20,12 @@ This is a separate file to not bloat the main sim.py test file.
 from __future__ import annotations
 
 import dataclasses
+import functools
 from typing import Any
 
 from absl.testing import absltest
 import chex
+import jax
 from jax import numpy as jnp
 import numpy as np
 from torax import core_profile_setters
@@ -68,17 +70,20 @@ class SimOutputSourceProfilesTest(sim_test_case.SimTestCase):
     # explicit profiles has non-zero values. That is what makes the summing
     # correct. For this test though, we are simply checking that things are
     # summed in the first place.
-    # Build a fake set of source profiles which have all 1s in all the profiles.
-    fake_implicit_source_profiles = _build_source_profiles_with_single_value(
-        geo=geo,
-        source_models=source_models,
-        value=1.0,
+    # Build a fake set of source profiles which have all 1s in all the profiles,
+    # and a fake set with all 2s. Both sets are built in one batched call.
+    fake_source_profiles = jax.vmap(
+        lambda value: _build_source_profiles_with_single_value(
+            geo=geo,
+            source_models=source_models,
+            value=value,
+        )
+    )(jnp.array([1.0, 2.0]))
+    fake_implicit_source_profiles = jax.tree_util.tree_map(
+        lambda x: x[0], fake_source_profiles
     )
-    # And a fake set of profiles with all 2s.
-    fake_explicit_source_profiles = _build_source_profiles_with_single_value(
-        geo=geo,
-        source_models=source_models,
-        value=2.0,
+    fake_explicit_source_profiles = jax.tree_util.tree_map(
+        lambda x: x[1], fake_source_profiles
     )
     qei_core_profiles = core_profile_setters.initial_core_profiles(
         dynamic_runtime_params_slice=dynamic_runtime_params_slice,
@@ -88,11 +93,11 @@ class SimOutputSourceProfilesTest(sim_test_case.SimTestCase):
     qei_core_profiles = dataclasses.replace(
         qei_core_profiles,
         temp_ion=cell_variable.CellVariable(
-            value=jnp.ones_like(geo.r) * 1.0,
+            value=jnp.full(geo.r.shape, 1.0, dtype=geo.r.dtype),
             dr=geo.dr,
         ),
         temp_el=cell_variable.CellVariable(
-            value=jnp.ones_like(geo.r) * 3.0,
+            value=jnp.full(geo.r.shape, 3.0, dtype=geo.r.dtype),
             dr=geo.dr,
         ),
     )
@@ -128,7 +133,7 @@ class SimOutputSourceProfilesTest(sim_test_case.SimTestCase):
         geo,
         unused_state,
     ):
-      return jnp.ones_like(geo.r) * source_conf.foo
+      return jnp.full(geo.r.shape, source_conf.foo, dtype=geo.r.dtype)
 
     # Include 2 versions of this source, one implicit and one explicit.
     source_models = source_models_lib.SourceModels(
@@ -195,32 +200,37 @@ class SimOutputSourceProfilesTest(sim_test_case.SimTestCase):
     # on the state and config at time t. So both the implicit and explicit
     # profiles of each time step should be equal in this case (especially
     # because we are using the fake step function defined below).
-    for i, sim_state in enumerate(sim_states):
-      np.testing.assert_allclose(
-          sim_state.core_sources.profiles['implicit_ne_source'], i + 1
+    # Step i's profiles should all equal i + 1.
+    expected = np.arange(1, len(sim_states) + 1)[:, np.newaxis]
+    for name in ('implicit_ne_source', 'explicit_ne_source'):
+      profiles = np.stack(
+          [sim_state.core_sources.profiles[name] for sim_state in sim_states]
       )
       np.testing.assert_allclose(
-          sim_state.core_sources.profiles['explicit_ne_source'], i + 1
+          profiles, np.broadcast_to(expected, profiles.shape)
       )
 
 
+# Jitted so that all the filled profiles are built in a single dispatch rather
+# than one eager op per array.
+@functools.partial(jax.jit, static_argnames=['source_models'])
 def _build_source_profiles_with_single_value(
     geo: geometry.Geometry,
     source_models: source_models_lib.SourceModels,
     value: float,
 ):
-  cell_1d_arr = jnp.ones_like(geo.r) * value
-  face_1d_arr = jnp.ones_like(geo.r_face) * value
+  cell_1d_arr = jnp.full(geo.r.shape, value, dtype=geo.r.dtype)
+  face_1d_arr = jnp.full(geo.r_face.shape, value, dtype=geo.r_face.dtype)
   return source_profiles_lib.SourceProfiles(
       profiles={
-          name: jnp.ones(shape=src.output_shape_getter(geo)) * value
+          name: jnp.full(src.output_shape_getter(geo), value)
           for name, src in source_models.standard_sources.items()
       },
       j_bootstrap=source_profiles_lib.BootstrapCurrentProfile(
           sigma=cell_1d_arr * value,
           j_bootstrap=cell_1d_arr * value,
           j_bootstrap_face=face_1d_arr * value,
-          I_bootstrap=jnp.ones(()) * value,
+          I_bootstrap=jnp.asarray(value),
       ),
       qei=source_profiles_lib.QeiInfo(
           qei_coef=cell_1d_arr,
@@ -294,11 +304,26 @@ class _FakeSimulationStepFn(sim_lib.SimulationStepFn):
         transport_model=constant_transport_model.ConstantTransportModel(),
         source_models=source_models,
     )
+    # Each step's new time is the next step's input time, so cache the slices
+    # rather than interpolating the runtime params twice at every time.
+    self._dynamic_runtime_params_slices = {}
 
   @property
   def stepper(self):
     return self._stepper
 
+  def _get_dynamic_runtime_params_slice(
+      self,
+      dynamic_runtime_params_slice_provider: runtime_params_slice.DynamicRuntimeParamsSliceProvider,
+      t: jnp.ndarray,
+  ) -> runtime_params_slice.DynamicRuntimeParamsSlice:
+    t = float(t)
+    if t not in self._dynamic_runtime_params_slices:
+      self._dynamic_runtime_params_slices[t] = (
+          dynamic_runtime_params_slice_provider(t)
+      )
+    return self._dynamic_runtime_params_slices[t]
+
   def __call__(
       self,
       static_runtime_params_slice: runtime_params_slice.StaticRuntimeParamsSlice,
@@ -308,8 +333,8 @@ class _FakeSimulationStepFn(sim_lib.SimulationStepFn):
       explicit_source_profiles: source_profiles_lib.SourceProfiles,
   ) -> state_module.ToraxSimState:
     dt, ts_state = self._time_step_calculator.next_dt(
-        dynamic_runtime_params_slice=dynamic_runtime_params_slice_provider(
-            input_state.t
+        dynamic_runtime_params_slice=self._get_dynamic_runtime_params_slice(
+            dynamic_runtime_params_slice_provider, input_state.t
         ),
         geo=geometry_provider(input_state.t),
         core_profiles=input_state.core_profiles,
@@ -324,8 +349,8 @@ class _FakeSimulationStepFn(sim_lib.SimulationStepFn):
         time_step_calculator_state=ts_state,
         # The returned source profiles include only the implicit sources.
         core_sources=source_models_lib.build_source_profiles(
-            dynamic_runtime_params_slice=dynamic_runtime_params_slice_provider(
-                new_t
+            dynamic_runtime_params_slice=self._get_dynamic_runtime_params_slice(
+                dynamic_runtime_params_slice_provider, new_t
             ),
             geo=geometry_provider(new_t),
             core_profiles=input_state.core_profiles,  # no state evolution.
@@ -126,7 +126,7 @@ class ExplicitStepper(stepper_lib.Stepper):
     temp_ion_new = dataclasses.replace(
         core_profiles_t.temp_ion,
         value=temp_ion_new,
-        **updated_boundary_conditions['temp_ion'],
+        **updated_boundary_conditions.temp_ion,
     )
 
     q_face, _ = physics.calc_q_from_jtot_psi(